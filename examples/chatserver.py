@@ -9,6 +9,13 @@ sys.path.insert(0, root)
 from websocket.client import Client
 from websocket.server import WebSocketServer
 from websocket.stream.reader import WebSocketReader
+from websocket.stream.writer import WebSocketWriter
+
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
 
 loop = asyncio.get_event_loop()
 socket = WebSocketServer("localhost", 3001, loop=loop)
@@ -18,8 +25,13 @@ async def notify_of(client):
     await send_message(f'New client connected! {hex(id(client))}')
 
 async def send_message(msg):
-    for other in socket.clients.values():
-        await other.writer.send(msg)
+    # The frame is the same for every client, so serialize it once up front
+    if isinstance(msg, str):
+        frame = WebSocketWriter.build_text_frame(msg)
+    else:
+        frame = WebSocketWriter.build_binary_frame(msg)
+
+    await socket.broadcast(frame)
 
 
 @socket.connection
@@ -10,6 +10,12 @@ from websocket.client import Client
 from websocket.server import WebSocketServer
 from websocket.stream.reader import WebSocketReader
 
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 loop = asyncio.get_event_loop()
 socket = WebSocketServer("localhost", 3001, loop=loop)
 
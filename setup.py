@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 
-from setuptools import setup
+from setuptools import Extension, setup
+
+# The compiled unmasking is optional, if it can't be built websocket.stream.mask falls back to python
+mask_extension = Extension('websocket.stream._mask', sources=['websocket/stream/_mask.c'], optional=True)
 
 setup(name='asws3',
       version='1.0.1',
@@ -10,5 +13,7 @@ setup(name='asws3',
       url='https://github.com/regiontog/asws',
       keywords=['websocket', 'python3.6', 'asynchronous', 'asyncio', 'async'],
       packages=["websocket", "websocket.stream", "websocket.http"],
+      extras_require={'fast': ['uvloop', 'numpy']},
+      ext_modules=[mask_extension],
       classifiers=[],
-)
\ No newline at end of file
+)
@@ -18,6 +18,12 @@ logging.basicConfig(level=logging.DEBUG,
 
 logger = logging.getLogger(__name__)
 
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 loop = asyncio.get_event_loop()
 socket = WebSocketServer("localhost", 3001, loop=loop)
 
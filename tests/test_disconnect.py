@@ -0,0 +1,87 @@
+"""Messages that arrived in full must still be readable after the connection with the client is gone.
+
+Run with ``python3.6 -m unittest discover -s tests`` from the repository root.
+"""
+import asyncio
+import os
+import struct
+import sys
+import unittest
+
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, root)
+
+from websocket.client import ConnectionClosed
+from websocket.server import WebSocketServer
+
+HANDSHAKE = (b'GET / HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n'
+             b'Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\nSec-WebSocket-Version: 13\r\n\r\n')
+MASK = b'\x12\x34\x56\x78'
+
+
+def masked_frame(op_code, payload):
+    length = len(payload)
+    if length < 126:
+        header = struct.pack('!BB', 0x80 | op_code, 0x80 | length)
+    elif length < 1 << 16:
+        header = struct.pack('!BBH', 0x80 | op_code, 0x80 | 126, length)
+    else:
+        header = struct.pack('!BBQ', 0x80 | op_code, 0x80 | 127, length)
+
+    key = (MASK * (length // 4 + 1))[:length]
+    masked = (int.from_bytes(payload, 'little') ^ int.from_bytes(key, 'little')).to_bytes(length, 'little')
+    return header + MASK + masked
+
+
+class TestDisconnect(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.socket = WebSocketServer('127.0.0.1', 0, loop=self.loop, timeout=0)
+        self.received = self.loop.create_future()
+
+        @self.socket.connection
+        async def on_connection(client):
+            @client.message
+            async def on_message(reader):
+                # Give the connection time to go away before the message is read
+                await asyncio.sleep(0.1, loop=self.loop)
+                try:
+                    self.received.set_result(await reader.get())
+                except Exception as e:
+                    self.received.set_exception(e)
+
+        self.server = self.socket.__enter__()
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    def tearDown(self):
+        self.socket.__exit__(None, None, None)
+        self.loop.close()
+
+    def send_then_disconnect(self, data):
+        async def client():
+            reader, writer = await asyncio.open_connection('127.0.0.1', self.port, loop=self.loop)
+            writer.write(HANDSHAKE)
+            await reader.readuntil(b'\r\n\r\n')
+            writer.write(data)
+            await writer.drain()
+            writer.close()
+            return await asyncio.wait_for(self.received, 5, loop=self.loop)
+
+        return self.loop.run_until_complete(client())
+
+    def test_complete_message_then_disconnect(self):
+        text = 'x' * 100
+        self.assertEqual(self.send_then_disconnect(masked_frame(0x1, text.encode())), text)
+
+    def test_disconnect_in_middle_of_message(self):
+        # The first frame of a fragmented message, the message never ends
+        frame = bytearray(masked_frame(0x1, b'x' * 100))
+        frame[0] &= 0x7F
+        with self.assertRaises(ConnectionClosed):
+            self.send_then_disconnect(bytes(frame))
+
+    def test_large_message_then_close(self):
+        # Much larger than the reader's buffer, so most of it is still queued when the close frame is handled
+        text = 'x' * 200000
+        close = masked_frame(0x8, struct.pack('!H', 1000))
+        self.assertEqual(self.send_then_disconnect(masked_frame(0x1, text.encode()) + close), text)
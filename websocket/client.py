@@ -10,23 +10,32 @@ You should not make an instance of the Client class yourself, rather you should
 import asyncio
 import logging
 
-import time
-
 from .enums import DataType, State
-from .reasons import Reasons, Reason
+from .reasons import Reasons, Reason, NORMAL, NO_STATUS
 from .stream.reader import WebSocketReader
 from .stream.writer import WebSocketWriter
 
 logger = logging.getLogger(__name__)
 
 
+def peer_repr(addr, port):
+    """Format a peer address for logging, IPv6 addresses are bracketed so that the port is unambiguous.
+
+    :return: :class:`str` e.g. ``127.0.0.1:8080`` or ``[::1]:8080``
+    """
+    if ':' in addr:
+        return f"[{addr}]:{port}"
+
+    return f"{addr}:{port}"
+
+
 class NoCallbackException(Exception):
     pass
 
 
 class UnexpectedFrameException(Exception):
     def __init__(self, client, recv, expect):
-        super().__init__(f"Received unexpected {recv.name.lower()} frame from client {client.addr, client.port}, "
+        super().__init__(f"Received unexpected {recv.name.lower()} frame from client {client._peer_repr}, "
                          f"expected {expect.name.lower()}.")
 
         self.recieved = recv
@@ -47,13 +56,22 @@ class Client:
     :type port: int
     :ivar writer: The writer used for writing frames to the client.
     :type writer: WebSocketWriter
+
+    You may attach your own per connection state to a client, e.g. ``client.nick = 'Alice'``.
     """
+    # There may be many thousands of clients, so their own attributes live in slots. The __dict__ slot keeps
+    # attaching per connection state to a client working, the dict is only allocated once something is attached.
+    __slots__ = ('last_message', 'state', 'addr', 'port', '_peer', '_peer_repr', 'data_type', 'writer', '_reader',
+                 'read_task', 'continuation', 'server_has_initiated_close', '_loop', '_ctrl_reader', '_close_reader',
+                 'type', 'on_message', 'on_ping', 'on_pong', 'on_closed', '_on_closed_is_noop', '__dict__')
 
     def __init__(self, state, addr, port, writer, loop):
-        self.last_message = time.time()
+        self.last_message = loop.time()
         self.state = state
         self.addr = addr
         self.port = port
+        self._peer = (addr, port)
+        self._peer_repr = peer_repr(addr, port)
         self.data_type = DataType.NONE
         self.writer = WebSocketWriter(writer, loop)
         self._reader = None
@@ -62,6 +80,11 @@ class Client:
         self.server_has_initiated_close = False
         self._loop = loop
 
+        # Control frames carry at most 125 bytes, so a single reader is reused for all of them,
+        # created by the first control frame
+        self._ctrl_reader = None
+        self._close_reader = None  # Drains a frame that the connection is being closed over
+
         @self.message
         async def on_message(reader):
             raise NoCallbackException("No message callback defined.")
@@ -78,6 +101,9 @@ class Client:
         async def on_closed(code, reason):
             pass
 
+        # Lets close skip scheduling the callback until the user registers one
+        self._on_closed_is_noop = True
+
     def message(self, fn):
         """Decorator for registering the on_message callback.
         
@@ -141,113 +167,157 @@ class Client:
         ...     print("Connection with client is closing for " + reason)
         """
         self.on_closed = fn
+        self._on_closed_is_noop = False
 
-    async def close_with_read(self, reader, code, reason):
+    async def close_with_read(self, reader, length_byte, code, reason):
+        # Drain the rest of the offending frame while the close frame is sent, if we waited for the close to drain
+        # first a peer that is blocked writing the frame would never read it.
         close = asyncio.ensure_future(self.close(code, reason), loop=self._loop)
-        buffer = WebSocketReader(DataType.BINARY, self, self._loop)
-        length = await buffer.feed(reader)
+
+        # The offending frame may be of any size, so it does not go through the control frame reader
+        buffer = self._close_reader = WebSocketReader(DataType.BINARY, self, self._loop)
+        length = await buffer.feed(reader, length_byte)
         buffer.done()
-        logger.debug("1")
         data = await buffer.read(length)
-        logger.debug("2")
         await close
         return data
 
-    async def close(self, code: bytes, reason: str):
+    async def close(self, code, reason):
+        """
+        :param code: The reason for closing, see :class:`~websocket.reasons.Reasons`.
+        :type code: :class:`~websocket.reasons.Reason`
+        :param reason: The reason for closing, bytes are taken to be already utf-8 encoded and are sent as is.
+        :type reason: str or bytes
+        """
         if not self.server_has_initiated_close:
-            asyncio.ensure_future(self.on_closed(code, reason), loop=self._loop)
+            if not self._on_closed_is_noop:
+                self._loop.create_task(self.on_closed(code, reason if isinstance(reason, str) else reason.decode()))
+
             self.server_has_initiated_close = True
             await self.writer.close(code, reason)
 
             # TODO: Kill in 5 secs if client dont respond
 
-    async def _read_message(self, reader, fin):
-        await self._reader.feed(reader)
-
-        if fin:
-            self.continuation = DataType.NONE
-            self._reader.done()
-        else:
-            self.continuation = self._reader.data_type
-
     @staticmethod
     def handle_data(kind):
-        async def handler(self, reader, fin):
+        name = kind.name.lower()
+
+        async def handler(self, reader, fin, length_byte):
             if self.continuation != DataType.NONE:
                 self._reader.set_exception(UnexpectedFrameException(self, kind, DataType.CONTINUATION))
 
                 self._reader.done()
-                await self.close_with_read(reader, Reasons.PROTOCOL_ERROR.value, "expected continuation frame")
+                await self.close_with_read(reader, length_byte, Reasons.PROTOCOL_ERROR.value, "expected continuation frame")
                 return
 
-            logger.debug(f"Received {kind.name.lower()} data frame from client {self.addr, self.port}.")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received %s data frame from client %s.", name, self._peer_repr)
+
             self.type = kind
             self._reader = WebSocketReader(kind, self, self._loop)
             self._loop.create_task(self.on_message(self._reader))
 
-            return await self._read_message(reader, fin)
+            # The message state machine is inlined here and in handle_continuation rather than shared through
+            # a helper coroutine, this saves creating and awaiting an extra coroutine object for every data frame.
+            await self._reader.feed(reader, length_byte)
+
+            if fin:
+                self._reader.done()
+            else:
+                self.continuation = kind
 
         return handler
 
-    async def handle_continuation(self, reader, fin):
+    async def handle_continuation(self, reader, fin, length_byte):
         if self.continuation == DataType.NONE:
-            logger.debug("Received unexpected continuation data frame from client "
-                         f"{self.addr, self.port}, expected {self.continuation.name.lower()}.")
+            logger.debug("Received unexpected continuation data frame from client %s, expected %s.",
+                         self._peer_repr, self.continuation.name.lower())
 
-            await self.close_with_read(reader, Reasons.PROTOCOL_ERROR.value,
+            await self.close_with_read(reader, length_byte, Reasons.PROTOCOL_ERROR.value,
                                        f"expected {self.continuation.name.lower()} frame")
             return
 
-        logger.debug(f"Received continuation frame from client {self.addr, self.port}.")
-        await self._read_message(reader, fin)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received continuation frame from client %s.", self._peer_repr)
+
+        await self._reader.feed(reader, length_byte)
+
+        if fin:
+            self.continuation = DataType.NONE
+            self._reader.done()
 
     def ensure_clean_close(self):
         if self.continuation != DataType.NONE:
             self._reader.set_exception(ConnectionClosed())
             self._reader.done()
 
+    def _control_reader(self):
+        if self._ctrl_reader is None:
+            self._ctrl_reader = WebSocketReader(DataType.BINARY, self, self._loop)
+        else:
+            self._ctrl_reader.reset()
+
+        return self._ctrl_reader
+
+    def cancel_readers(self):
+        """Stop the readers of this client from processing any more frames, called once the connection is gone.
+
+        Messages that arrived in full are still processed, so that they can be read after the connection is gone.
+        """
+        for buffer in (self._reader, self._close_reader):
+            if buffer is not None:
+                buffer.connection_lost(ConnectionClosed())
+
+        if self._ctrl_reader is not None:
+            self._ctrl_reader.cancel()
+
     @staticmethod
     def handle_ping_or_pong(kind):
-        async def handler(self, reader, fin):
-            buffer = WebSocketReader(DataType.BINARY, self, self._loop)
-            feed = asyncio.ensure_future(buffer.feed_once(reader), loop=self._loop)
+        name = kind.name.lower()
 
-            if not fin or self.server_has_initiated_close:
-                if not fin:
-                    logger.warning(f"Received fragmented {kind.name.lower()} from client {self.addr, self.port}.")
-                    self.ensure_clean_close()
-                    await self.close(Reasons.PROTOCOL_ERROR.value, "fragmented control frame")
-                else:
-                    logger.warning(f"Received {kind.name.lower()} from client {self.addr, self.port} after server "
-                                   "initiated close.")
+        async def handler(self, reader, fin, length_byte):
+            buffer = self._control_reader()
+
+            if fin and not self.server_has_initiated_close:
+                # This is the steady state keepalive traffic, read the payload inline without wrapping it in a task.
+                length = await buffer.feed_once(reader, length_byte)
+                if length > 125:
+                    logger.warning("%s payload too long(%d bytes).", name, length)
                     self.ensure_clean_close()
-                    await self.close(Reasons.POLICY_VIOLATION.value, "control frame after close")
+                    await self.close(Reasons.PROTOCOL_ERROR.value, "control frame too long")
+                    return
 
-                await feed
-                return
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Received %s from client %s.", name, self._peer_repr)
+
+                data = await buffer.read(length)
+                if kind is DataType.PING:
+                    self._loop.create_task(self.on_ping(data, length))
+                elif kind is DataType.PONG:
+                    self._loop.create_task(self.on_pong(data, length))
 
-            length = await feed
-            if length > 125:
-                logger.warning(f"{kind.name.lower()} payload too long({length} bytes).")
-                self.ensure_clean_close()
-                await self.close(Reasons.PROTOCOL_ERROR.value, "control frame too long")
                 return
 
-            logger.debug(f"Received {kind.name.lower()} from client {self.addr, self.port}.")
-            data = await buffer.read(length)
-            if kind is DataType.PING:
-                self._loop.create_task(self.on_ping(data, length))
-            elif kind is DataType.PONG:
-                self._loop.create_task(self.on_pong(data, length))
+            # Drain the frame concurrently while we close the connection.
+            feed = asyncio.ensure_future(buffer.feed_once(reader, length_byte), loop=self._loop)
+            if not fin:
+                logger.warning("Received fragmented %s from client %s.", name, self._peer_repr)
+                self.ensure_clean_close()
+                await self.close(Reasons.PROTOCOL_ERROR.value, "fragmented control frame")
+            else:
+                logger.warning("Received %s from client %s after server initiated close.",
+                               name, self._peer_repr)
+                self.ensure_clean_close()
+                await self.close(Reasons.POLICY_VIOLATION.value, "control frame after close")
 
-            buffer.done()
+            await feed
         return handler
 
-    async def handle_close(self, reader, fin):
-        logger.debug(f"Received close from client {self.addr, self.port}.")
+    async def handle_close(self, reader, fin, length_byte):
+        logger.debug("Received close from client %s.", self._peer_repr)
 
-        buffer = WebSocketReader(DataType.BINARY, self, self._loop)
-        length = await buffer.feed_once(reader)
+        buffer = self._control_reader()
+        length = await buffer.feed_once(reader, length_byte)
         reason = await buffer.read(length)
 
         if not self.server_has_initiated_close:
@@ -255,8 +325,8 @@ class Client:
                 code, reason = Reasons.PROTOCOL_ERROR.value, "control frame too long"
             else:
                 code, reason = Reason.from_bytes(reason, length)
-                if code == Reasons.NO_STATUS.value:
-                    code = Reasons.NORMAL.value
+                if code is NO_STATUS:
+                    code = NORMAL
 
             self.ensure_clean_close()
             await self.close(code, reason)
@@ -266,20 +336,25 @@ class Client:
         if self.read_task is not None:
             self.read_task.cancel()
 
-    async def handle_undefined(self, reader, fin):
-        logger.debug(f"Received invalid opcode from client {self.addr, self.port}.")
+    async def handle_undefined(self, reader, fin, length_byte):
+        logger.debug("Received invalid opcode from client %s.", self._peer_repr)
 
-        await self.close_with_read(reader, Reasons.PROTOCOL_ERROR.value, "invalid opcode")
+        await self.close_with_read(reader, length_byte, Reasons.PROTOCOL_ERROR.value, "invalid opcode")
 
     def tick(self):
-        self.last_message = time.time()
-
-HANDLERS = {opcode: Client.handle_undefined for opcode in range(0, 1 << 4)}
-HANDLERS.update({
-    DataType.CONTINUATION.value: Client.handle_continuation,
-    DataType.TEXT.value: Client.handle_data(DataType.TEXT),
-    DataType.BINARY.value: Client.handle_data(DataType.BINARY),
-    DataType.CLOSE.value: Client.handle_close,
-    DataType.PING.value: Client.handle_ping_or_pong(DataType.PING),
-    DataType.PONG.value: Client.handle_ping_or_pong(DataType.PONG),
-})
+        self.last_message = self._loop.time()
+
+# Opcodes are 4 bits, so the handlers live in a 16 element tuple indexed directly by the opcode.
+HANDLERS = [Client.handle_undefined] * (1 << 4)
+HANDLERS[DataType.CONTINUATION] = Client.handle_continuation
+HANDLERS[DataType.TEXT] = Client.handle_data(DataType.TEXT)
+HANDLERS[DataType.BINARY] = Client.handle_data(DataType.BINARY)
+HANDLERS[DataType.CLOSE] = Client.handle_close
+HANDLERS[DataType.PING] = Client.handle_ping_or_pong(DataType.PING)
+HANDLERS[DataType.PONG] = Client.handle_ping_or_pong(DataType.PONG)
+HANDLERS = tuple(HANDLERS)
+
+# Everything dispatch needs to know about the first header byte, (handler, fin, rsv bits set), indexed by the byte
+FRAME_BYTE_TABLE = tuple((HANDLERS[byte & WebSocketReader.OP_CODE_BITS],
+                          (byte & WebSocketReader.FIN_BIT) != 0,
+                          (byte & WebSocketReader.RSV_BITS) != 0) for byte in range(1 << 8))
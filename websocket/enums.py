@@ -1,4 +1,4 @@
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 
 
 class State(Enum):
@@ -11,8 +11,12 @@ class State(Enum):
     """The connection is going down."""
 
 
-class DataType(Enum):
-    """Enum of all frame operation codes"""
+class DataType(IntEnum):
+    """Enum of all frame operation codes, the members are ints and can be used directly as opcodes.
+
+    :ivar fin_header: The first header byte of an unfragmented frame of this type, this is not set on :attr:`NONE`.
+    :type fin_header: bytes
+    """
     NONE = -1
     """No data type"""
     CONTINUATION = 0x0
@@ -29,4 +33,17 @@ class DataType(Enum):
     """Pong control frame"""
 
     def header(self, flags):
-        return (self.value | flags << 4).to_bytes(1, 'big')
+        """
+        :param flags: The FIN and RSV bits as the high nibble of the first header byte, 8 for FIN.
+        :return: The first byte of a frame header with this opcode, see also :attr:`fin_header`.
+        """
+        return HEADER_BYTES[self | flags << 4]
+
+
+# Every possible first header byte is prebuilt, so no frame has to build its header byte
+HEADER_BYTES = tuple(bytes((byte,)) for byte in range(1 << 8))
+
+for _kind in DataType:
+    if _kind is not DataType.NONE:
+        # The first byte of an unfragmented frame of this type
+        _kind.fin_header = _kind.header(8)
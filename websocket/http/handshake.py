@@ -1,20 +1,27 @@
 import base64
 import hashlib
 
-newline = "\r\n"
-sep = ": "
-methods = ["GET"]
-protocols = ["HTTP/1.1"]
+# The handshake is parsed as bytes, so no line is ever decoded and all comparisons are done by CPython's bytes methods
+newline = b"\r\n"
+sep = b":"
+methods = [b"GET"]
+protocols = [b"HTTP/1.1"]
+
+UPGRADE = b"upgrade"
+WEBSOCKET = b"websocket"
 
 supported_ws_versions = [13]
 
+# GUID from RFC 6455 appended to the client key when computing Sec-WebSocket-Accept.
+MAGIC_STR = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
 
 class BadRequestException(Exception):
     RESPONSE = b"HTTP/1.1 400 Bad Request\r\n"
 
 
 class WebSocketConnection:
-    MAGIC_STR = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+    MAGIC_STR = MAGIC_STR
 
     def __init__(self, version, key):
         if version not in supported_ws_versions:
@@ -22,22 +29,25 @@ class WebSocketConnection:
 
         self.version = version
         self.key = key
+        self._accept = self.accept_key()
+        self._response = b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n" \
+                         b"Sec-WebSocket-Accept: " + self._accept + b"\r\n\r\n"
 
     def response(self):
-        return b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\nSec-WebSocket-Accept: " + self.accept_key() + b"\r\n\r\n"
+        return self._response
 
     def accept_key(self):
-        m = hashlib.sha1()
-        m.update(str.encode(self.key))
-        m.update(WebSocketConnection.MAGIC_STR)
-        return base64.b64encode(m.digest())
+        return base64.b64encode(hashlib.sha1(self.key + MAGIC_STR).digest())
 
 
 class Request:
     def __init__(self, request_line):
         self.attrs = {}
 
-        request_line = request_line.split(" ")
+        request_line = request_line.split(b" ")
+        if len(request_line) != 3:
+            self.error(f"Malformed request line {b' '.join(request_line)}.")
+
         if request_line[0] not in methods:
             self.error(f"Unknown or invalid method {request_line[0]}.")
 
@@ -50,28 +60,41 @@ class Request:
         self.path = request_line[1]
 
     def header(self, header):
-        key, val = header.split(sep, 2)
-        self.attrs[key] = val[:-2]  # Remove trailing \r\n
+        try:
+            key, val = header.split(sep, 1)
+        except ValueError:
+            self.error(f"Malformed header {header}.")
+
+        # Header names are case insensitive, and the value may be surrounded by whitespace besides the trailing \r\n
+        self.attrs[key.strip().lower()] = val.strip()
 
     def validate_header(self, header, value):
-        return header in self.attrs and self.attrs[header].lower() == value
+        """:param header: Lowercase header name, e.g. ``b"connection"``
+        :param value: Lowercase value to compare against, e.g. :data:`UPGRADE`"""
+        actual = self.attrs.get(header)
+        return actual is not None and actual.lower() == value
 
     def validate_websocket_request(self):
-        if not self.validate_header("Connection", "upgrade"):
+        if not self.validate_header(b"connection", UPGRADE):
             self.error("Connection header must be of Upgrade type.")
 
-        if not self.validate_header("Upgrade", "websocket"):
+        if not self.validate_header(b"upgrade", WEBSOCKET):
             self.error("Missing or invalid upgrade header.")
 
-        if "Sec-WebSocket-Key" not in self.attrs:
+        key = self.attrs.get(b"sec-websocket-key")
+        if key is None:
             self.error("Missing Sec-WebSocket-Key header.")
 
-        if "Sec-WebSocket-Version" not in self.attrs:
+        version = self.attrs.get(b"sec-websocket-version")
+        if version is None:
             self.error("Missing Sec-WebSocket-Version header.")
 
-        self.websocket = WebSocketConnection(
-            int(self.attrs["Sec-WebSocket-Version"]),
-            self.attrs["Sec-WebSocket-Key"])
+        try:
+            version = int(version)
+        except ValueError:
+            self.error(f"Invalid websocket version {version}.")
+
+        self.websocket = WebSocketConnection(version, key)
 
         return self.websocket.response()
 
@@ -10,15 +10,18 @@ class DuplicateReasonException(Exception):
 
 class Reason:
     """ """
+    __slots__ = ('code', 'code_bytes', 'close_frame', 'description')
     INSTANCES = {}
 
     def __init__(self, code):
-        code = bytes(code)
+        code = int(code)
         if code in Reason.INSTANCES:
             raise DuplicateReasonException("Duplicate entry.")
 
         Reason.INSTANCES[code] = self
         self.code = code
+        self.code_bytes = code.to_bytes(2, 'big')  # The code as it is sent in a close frame
+        self.close_frame = b'\x88\x02' + self.code_bytes  # A whole close frame with this code and no reason
         self.description = ''
 
     def set_description(self, desc):
@@ -29,85 +32,84 @@ class Reason:
         """This is the accepted way to dynamically acquire an Reason object. Prefer to 
         use Enum :class:`~websocket.reasons.Reasons` when possible.
         
-        :param code: The code of the reason object you wish to get.
+        :param code: The code of the reason object you wish to get, this must be an :class:`int`.
+        :type code: int
         
         :return: :class:`~websocket.reasons.Reason`
         """
-        for other_code in Reason.INSTANCES:
-            if code == other_code:
-                return Reason.INSTANCES[other_code]
-        else:
-            return Reason(code)
+        instance = cls.INSTANCES.get(code)
+        return instance if instance is not None else cls(code)
 
     @staticmethod
     def from_bytes(data, length):
         if length == 0:
-            return Reasons.NO_STATUS.value, ''
+            return NO_STATUS, ''
         elif length < 2:
-            return Reasons.PROTOCOL_ERROR.value, 'invalid close code length'
+            return PROTOCOL_ERROR, 'invalid close code length'
 
-        code = data[:2]
+        code = (data[0] << 8) | data[1]
 
-        if code < Reasons.NORMAL.value.code or code in INVALID_CODES or code in UNDEFINED_CODES:
+        # Codes 1012-1014 and 1016-2999 are not defined by the RFC, two comparisons cover them without a container
+        if code < _MIN_VALID_CODE or code in INVALID_CODES or 1012 <= code < 1015 or 1016 <= code < 3000:
             logger.warning("Client sent invalid close code.")
-            return Reasons.PROTOCOL_ERROR.value, 'invalid close code'
+            return PROTOCOL_ERROR, 'invalid close code'
 
         try:
             reason = data[2:].decode()
             return Reason.get(code), reason
         except UnicodeDecodeError:
-            return Reasons.PROTOCOL_ERROR.value, "invalid utf8 in close reason"
+            return PROTOCOL_ERROR, "invalid utf8 in close reason"
 
 
 class Reasons(Enum):
     """Enum with most defined reasons with their codes."""
 
-    NORMAL = Reason((1000).to_bytes(2, 'big'))
+    NORMAL = Reason(1000)
     """indicates a normal closure, meaning that the purpose for which the connection was
     established has been fulfilled."""
 
-    GOING_AWAY = Reason((1001).to_bytes(2, 'big'))
+    GOING_AWAY = Reason(1001)
     """indicates that an endpoint is "going away", such as a server going down or a browser
     having navigated away from a page."""
 
-    PROTOCOL_ERROR = Reason((1002).to_bytes(2, 'big'))
+    PROTOCOL_ERROR = Reason(1002)
     """indicates that an endpoint is terminating the connection due to a protocol error."""
 
-    UNACCEPTABLE_DATA = Reason((1003).to_bytes(2, 'big'))
+    UNACCEPTABLE_DATA = Reason(1003)
     """indicates that an endpoint is terminating the connection because it has received a
     type of data it cannot accept (e.g., an endpoint that understands only text data MAY
     send this if it receives a binary message)."""
 
-    RESERVED = Reason((1004).to_bytes(2, 'big'))
+    RESERVED = Reason(1004)
     """The specific meaning might be defined in the future."""
 
-    NO_STATUS = Reason((1005).to_bytes(2, 'big'))
+    NO_STATUS = Reason(1005)
     """reserved value and MUST NOT be set as a status code in a Close control frame by an endpoint.
     It is designated for use in applications expecting a status code to indicate that no status
     code was actually present."""
 
-    ABNORMAL_CLOSE = Reason((1006).to_bytes(2, 'big'))
+    ABNORMAL_CLOSE = Reason(1006)
     """reserved value and MUST NOT be set as a status code in a Close control frame by an
     endpoint. It is designated for use in applications expecting a status code to indicate
     that the connection was closed abnormally, e.g., without sending or receiving a Close
     control frame."""
 
-    INCONSISTENT_DATA = Reason((1007).to_bytes(2, 'big'))
+    INCONSISTENT_DATA = Reason(1007)
     """indicates that an endpoint is terminating the connection because it has received data
     within a message that was not consistent with the type of the message (e.g.,
     non-UTF-8 [RFC3629] data within a text message)."""
 
-    POLICY_VIOLATION = Reason((1008).to_bytes(2, 'big'))
+    POLICY_VIOLATION = Reason(1008)
     """indicates that an endpoint is terminating the connection because it has received a
     message that violates its policy.  This is a generic status code that can be returned
     when there is no other more suitable status code (e.g., 1003 or 1009) or if there is a
     need to hide specific details about the policy."""
 
-    MESSAGE_TOO_BIG = Reason((1009).to_bytes(2, 'big'))
+    MESSAGE_TOO_BIG = Reason(1009)
     """indicates that an endpoint is terminating the connection because it has received a
     message that is too big for it to process."""
 
-    EXTENSION_NOT_PRESENT = Reason((1010).to_bytes(2, 'big'))
+    EXTENSION_NOT_PRESENT = Reason(1010)
     """indicates that an endpoint (client) is terminating the connection because it has
     expected the server to negotiate one or more extension, but the server didn't
     return them in the response message of the WebSocket handshake.  The list of
@@ -115,11 +117,11 @@ class Reasons(Enum):
     Note that this status code is not used by the server, because it can fail the
     WebSocket handshake instead."""
 
-    UNEXPECTED_CONDITION = Reason((1011).to_bytes(2, 'big'))
+    UNEXPECTED_CONDITION = Reason(1011)
     """indicates that a server is terminating the connection because it encountered an
     unexpected condition that prevented it from fulfilling the request."""
 
-    TLS_HANDSHAKE_FAILURE = Reason((1015).to_bytes(2, 'big'))
+    TLS_HANDSHAKE_FAILURE = Reason(1015)
     """reserved value and MUST NOT be set as a status code in a Close control frame by an
     endpoint.  It is designated for use in applications expecting a status code to
     indicate that the connection was closed due to a failure to perform a TLS
@@ -130,13 +132,17 @@ class Reasons(Enum):
 for reason in Reasons:
     reason.value.set_description(reason.__doc__)
 
-INVALID_CODES = [reason.value.code for reason in [
+# The reasons used whenever a connection is closed, bound here to skip the enum lookup on every close
+NORMAL = Reasons.NORMAL.value
+NORMAL_CODE = NORMAL.code
+NO_STATUS = Reasons.NO_STATUS.value
+PROTOCOL_ERROR = Reasons.PROTOCOL_ERROR.value
+
+_MIN_VALID_CODE = NORMAL_CODE  # Codes below 1000 are never used
+
+INVALID_CODES = frozenset(reason.value.code for reason in [
     Reasons.RESERVED,
     Reasons.NO_STATUS,
     Reasons.ABNORMAL_CLOSE,
     Reasons.TLS_HANDSHAKE_FAILURE
-]]
-
-UNDEFINED_CODES = []
-UNDEFINED_CODES.extend(code.to_bytes(2, 'big') for code in range(1012, 1015))
-UNDEFINED_CODES.extend(code.to_bytes(2, 'big') for code in range(1016, 3000))
+])
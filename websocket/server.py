@@ -20,16 +20,15 @@
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 import ssl
 
-import time
-
-from .client import Client, HANDLERS
+from .client import Client, FRAME_BYTE_TABLE, peer_repr
 from .enums import State
 from .http import handshake
-from .reasons import Reasons
-from .stream.reader import WebSocketReader
+from .reasons import Reason, Reasons, NORMAL_CODE
 
 logger = logging.getLogger(__name__)
 
@@ -46,10 +45,17 @@ class WebSocketServer:
     :type certs: (certfile, keyfile)
     :ivar clients: All of the connected clients.
     :type clients: {(str, int): Client}
+    :ivar client_list: The same clients as :attr:`clients` as a list, for iterating over all of them e.g. to broadcast.
+        Not in any particular order, removing a client moves the last client into its place.
+    :type client_list: [Client]
     :ivar loop: The event loop to run in.
     :type loop: AbstractEventLoop 
     """
     NEWLINE = b'\r\n'
+    HANDSHAKE_TIMEOUT = 1  # Seconds a client has to send its whole upgrade request
+
+    # Clients with more than this many bytes waiting to be sent are waited on by broadcast, like asyncio's own default
+    BROADCAST_HIGH_WATER = 1 << 16
 
     def __init__(self, addr, port, certs=None, loop=None, timeout=120):
         if loop is None:
@@ -64,29 +70,53 @@ class WebSocketServer:
         self.certs = certs
         self.client_timeout = timeout
         self.clients = {}
+        self.client_list = []
+        self._client_index = {}  # The index of each client in client_list, by (addr, port)
         self.keepalive_task = None
 
+        # A heap of (deadline, counter, client), the counter breaks ties as clients can't be compared
+        self._deadlines = []
+        self._deadline_counter = itertools.count()
+
     async def keepalive(self, timeout):
         try:
             half = int(timeout / 2)
+            deadlines = self._deadlines
             while True:
                 await asyncio.sleep(half, loop=self.loop)
                 logger.info("Sending heartbeats")
-                cur_time = time.time()
+                cur_time = self.loop.time()
+
+                # Only the clients whose deadline has passed are looked at, the rest can't have gone quiet yet
+                due = []
+                while deadlines and deadlines[0][0] <= cur_time:
+                    due.append(heapq.heappop(deadlines)[2])
+
+                for client in due:
+                    if self.clients.get(client._peer) is not client:
+                        continue  # Disconnected since its deadline was set
 
-                for client in self.clients.values():
                     diff = cur_time - client.last_message
                     if diff > timeout:
-                        logger.warning(f"Cleaning up non-responsive client {client.addr, client.port}")
-                        self.disconnect_client(client, code=Reasons.POLICY_VIOLATION.value.code,
-                                               reason='Client did not respond to heartbeat.')
-
+                        logger.warning("Cleaning up non-responsive client %s.", client._peer_repr)
+                        self.loop.create_task(self.disconnect_client(client, code=Reasons.POLICY_VIOLATION.value.code,
+                                                                     reason='Client did not respond to heartbeat.'))
                     elif diff > half:
-                        client.writer.ping('heartbeat')
+                        self.loop.create_task(client.writer.ping(b'heartbeat'))
+                        self.set_deadline(client, client.last_message + timeout)
+                    else:
+                        self.set_deadline(client, client.last_message + half)
 
         except asyncio.CancelledError:
             pass
 
+    def set_deadline(self, client, deadline):
+        """Have :meth:`keepalive` check on a client again once it has been quiet until `deadline`.
+
+        Clients don't move their deadline when they send something, keepalive pushes it back when it comes due.
+        """
+        heapq.heappush(self._deadlines, (deadline, next(self._deadline_counter), client))
+
     def __enter__(self):
         """Start the server when entering the context manager."""
         context = None
@@ -132,11 +162,46 @@ class WebSocketServer:
 
     async def connect_client(self, client):
         await self._on_connection(client)
-        self.clients[client.addr, client.port] = client
+        self.clients[client._peer] = client
+        if self.client_timeout > 0:
+            self.set_deadline(client, client.last_message + int(self.client_timeout / 2))
+        self._client_index[client._peer] = len(self.client_list)
+        self.client_list.append(client)
+
+    async def broadcast(self, frame, force=False):
+        """Send the same frame to every connected client.
+
+        >>> await socket.broadcast(WebSocketWriter.build_text_frame("Hello everyone!"))
+
+        The frame is written straight to the transport of every client that is not already in the middle of sending
+        something, without waiting for each of them to drain. Clients that are busy, e.g. sending a fragmented message,
+        or that have more than :attr:`BROADCAST_HIGH_WATER` bytes waiting to be sent, get the frame with
+        :meth:`~websocket.stream.writer.WebSocketWriter.send_frame` instead, which waits for them to drain.
+
+        :param frame: A complete frame, see :meth:`~websocket.stream.writer.WebSocketWriter.build_text_frame`.
+        :type frame: bytes
+        :param force: If true send the frame even to clients the server has initiated close with.
+        :type force: bool
+        """
+        slow = []
+        for client in self.client_list:
+            writer = client.writer
+            if writer.write_lock.locked() or \
+                    writer.writer.transport.get_write_buffer_size() > WebSocketServer.BROADCAST_HIGH_WATER:
+                slow.append(writer.send_frame(frame, force))
+            elif writer.ensure_open(force):
+                writer.writer.write(frame)
+
+        if slow:
+            await asyncio.gather(*slow, return_exceptions=True)
 
     async def disconnect_all(self, timeout=1):
-        done, pending = await asyncio.wait(map(self.disconnect_client, self.clients.values()), loop=self.loop,
-                                           timeout=timeout)
+        # The tasks are all made before any of them runs, so clients removing themselves can't change what we iterate
+        tasks = [self.loop.create_task(self.disconnect_client(client)) for client in self.client_list]
+        if not tasks:
+            return
+
+        done, pending = await asyncio.wait(tasks, loop=self.loop, timeout=timeout)
 
         number_pending = len(pending)
         if number_pending > 0:
@@ -144,7 +209,7 @@ class WebSocketServer:
             for future in pending:
                 future.cancel()
 
-    async def disconnect_client(self, client, code=Reasons.NORMAL.value.code, reason=''):
+    async def disconnect_client(self, client, code=NORMAL_CODE, reason=''):
         """This method is the only clean way to close a connection with a client.
         
         >>> @socket.connection
@@ -154,56 +219,77 @@ class WebSocketServer:
 
         :param client: The client to disconnect from the server.
         :param code: The code to close the connection with, make sure it is valid. Default is :attr:`websocket.reasons.Reasons.NORMAL.value.code`
-        :type code: bytes
+        :type code: int
         :param reason: The reason for closing the connection, may be ''. Should not be longer than 123 characters.
         :type reason: str
         """
-        await client.close(code, reason)
-        del self.clients[client.addr, client.port]
+        await client.close(Reason.get(code), reason)
+        self.delete_client(client.addr, client.port)
 
     def delete_client(self, addr, port):
         try:
-            del self.clients[addr, port]
+            client = self.clients.pop((addr, port))
         except KeyError:
-            pass
+            return
+
+        # Swap the last client into the hole, so that removing a client does not scan or shift the list
+        index = self._client_index.pop(client._peer)
+        last = self.client_list.pop()
+        if last is not client:
+            self.client_list[index] = last
+            self._client_index[last._peer] = index
 
     async def socket_connect(self, reader, writer):
         addr, port, *_ = writer.get_extra_info('peername')
+        peer = peer_repr(addr, port)
+        client = None
         try:
-            logger.debug(f"Client {addr, port} connected, attempting handshake.")
+            logger.debug("Client %s connected, attempting handshake.", peer)
             state = await self.handle_handshake(reader, writer)
 
             if state != State.OPEN:
-                logger.warning(f"Handshake with client {addr, port} failed.")
+                logger.warning("Handshake with client %s failed.", peer)
             else:
-                logger.debug(f"Handshake with client {addr, port} successful.")
+                logger.debug("Handshake with client %s successful.", peer)
                 client = Client(state, addr, port, writer, self.loop)
                 self.loop.create_task(self.connect_client(client))
 
-                while client.state != State.CLOSING:
-                    client.read_task = self.loop.create_task(reader.readexactly(1))
+                # Everything the loop needs for every frame is bound to a local once
+                create_task = self.loop.create_task
+                readexactly = reader.readexactly
+                tick = client.tick
+                frame_table = FRAME_BYTE_TABLE
+                closing = State.CLOSING
+
+                while client.state is not closing:
+                    # The first two bytes of the header are always there, so they are read together
+                    client.read_task = create_task(readexactly(2))
                     try:
-                        data = (await client.read_task)[0]
-                        client.tick()
-                        if data & WebSocketReader.RSV_BITS > 0:
+                        data, length_byte = await client.read_task
+                        tick()
+
+                        # Find the correct handler based on the opcode
+                        handler, fin, rsv = frame_table[data]
+                        if rsv:
                             logger.warning("No extension defining RSV meaning has been negotiated")
                             client.ensure_clean_close()
-                            await client.close_with_read(reader, Reasons.PROTOCOL_ERROR.value, "RSV bit(s) set")
+                            await client.close_with_read(reader, length_byte, Reasons.PROTOCOL_ERROR.value,
+                                                         "RSV bit(s) set")
                             continue
 
-                        # Find the correct handler based on the opcode
-                        # Then pass it its arguments, including the fin flag
-                        await HANDLERS[data & WebSocketReader.OP_CODE_BITS](client, reader,
-                                                                            (data & WebSocketReader.FIN_BIT) != 0)
+                        await handler(client, reader, fin, length_byte)
                     except asyncio.CancelledError:
                         continue  # Someone has cancelled the read task, check for new state
         except ConnectionResetError:
-            logger.warning(f"Client {addr, port} has forcibly closed the connection.")
+            logger.warning("Client %s has forcibly closed the connection.", peer)
         except:
             raise
         finally:
-            logger.debug(f"Closing connection with client {addr, port}.")
+            logger.debug("Closing connection with client %s.", peer)
             writer.close()
+            if client is not None:
+                client.cancel_readers()
+
             self.delete_client(addr, port)
 
     def wait(self, fut, timeout):
@@ -216,18 +302,24 @@ class WebSocketServer:
         """
         return asyncio.wait_for(fut, timeout=timeout, loop=self.loop)
 
-    async def handle_handshake(self, reader, writer):
-        try:
-            request_line = await self.wait(reader.readuntil(WebSocketServer.NEWLINE), 1)
+    async def read_handshake(self, reader):
+        """Read and validate the websocket upgrade request of a client.
 
-            request = handshake.Request(request_line.decode())
-            header = await self.wait(reader.readuntil(WebSocketServer.NEWLINE), 1)
+        :return: :class:`bytes` the handshake response to send to the client.
+        """
+        request = handshake.Request(await reader.readuntil(WebSocketServer.NEWLINE))
+        header = await reader.readuntil(WebSocketServer.NEWLINE)
 
-            while header != WebSocketServer.NEWLINE:
-                request.header(header.decode())
-                header = await self.wait(reader.readuntil(WebSocketServer.NEWLINE), 1)
+        while header != WebSocketServer.NEWLINE:
+            request.header(header)
+            header = await reader.readuntil(WebSocketServer.NEWLINE)
 
-            response = request.validate_websocket_request()
+        return request.validate_websocket_request()
+
+    async def handle_handshake(self, reader, writer):
+        try:
+            # One deadline for the whole request, rather than a timer for every line of it
+            response = await self.wait(self.read_handshake(reader), WebSocketServer.HANDSHAKE_TIMEOUT)
             writer.write(response)
             return State.OPEN
         except handshake.BadRequestException:
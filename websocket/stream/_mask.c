@@ -0,0 +1,243 @@
+/*
+ * Compiled unmasking for websocket.stream.mask, see <https://tools.ietf.org/html/rfc6455#section-5.3>
+ *
+ * The payload is XOR-ed with the 4 byte key 16 bytes at a time with SSE2 on x86-64 or NEON on ARM,
+ * 8 bytes at a time elsewhere, and the remaining bytes one at a time. Text payloads can be validated as
+ * utf-8 in the same pass.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <stdint.h>
+#include <string.h>
+
+#if defined(__SSE2__) || defined(_M_X64)
+#include <emmintrin.h>
+#define ASWS_SSE2
+#elif defined(__ARM_NEON) || defined(__ARM_NEON__)
+#include <arm_neon.h>
+#define ASWS_NEON
+#endif
+
+static void
+unmask_inplace(uint8_t *buf, Py_ssize_t n, const uint8_t *mask)
+{
+    Py_ssize_t i = 0;
+    uint32_t key32;
+    uint64_t key64;
+
+    memcpy(&key32, mask, 4);
+    key64 = ((uint64_t)key32 << 32) | key32;
+
+#if defined(ASWS_SSE2)
+    {
+        __m128i key = _mm_set1_epi32((int)key32);
+        for (; i + 16 <= n; i += 16) {
+            __m128i data = _mm_loadu_si128((__m128i *)(buf + i));
+            _mm_storeu_si128((__m128i *)(buf + i), _mm_xor_si128(data, key));
+        }
+    }
+#elif defined(ASWS_NEON)
+    {
+        uint8x16_t key = vreinterpretq_u8_u32(vdupq_n_u32(key32));
+        for (; i + 16 <= n; i += 16) {
+            vst1q_u8(buf + i, veorq_u8(vld1q_u8(buf + i), key));
+        }
+    }
+#endif
+
+    /* i is a multiple of 16, so the key still starts at mask[0] */
+    for (; i + 8 <= n; i += 8) {
+        uint64_t data;
+        memcpy(&data, buf + i, 8);
+        data ^= key64;
+        memcpy(buf + i, &data, 8);
+    }
+
+    for (; i < n; i++) {
+        buf[i] ^= mask[i & 3];
+    }
+}
+
+/*
+ * UTF-8 validation with Bjoern Hoehrmann's DFA, <http://bjoern.hoehrmann.de/utf-8/decoder/dfa/>
+ * The first 256 entries map bytes to character classes, the rest map (state + class) to the next state.
+ */
+#define UTF8_ACCEPT 0
+#define UTF8_REJECT 12
+
+static const uint8_t utf8d[] = {
+    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+    1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,
+    7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,
+    8,8,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,
+    10,3,3,3,3,3,3,3,3,3,3,3,3,4,3,3,11,6,6,6,5,8,8,8,8,8,8,8,8,8,8,8,
+
+    0,12,24,36,60,96,84,12,12,12,48,72,12,12,12,12,12,12,12,12,12,12,12,12,
+    12,0,12,12,12,12,12,0,12,0,12,12,12,24,12,12,12,12,12,24,12,24,12,12,
+    12,12,12,12,12,12,12,24,12,12,12,12,12,24,12,12,12,12,12,12,12,24,12,12,
+    12,12,12,12,12,12,12,36,12,36,12,12,12,36,12,12,12,12,12,36,12,36,12,12,
+    12,36,12,12,12,12,12,12,12,12,12,12,
+};
+
+/* Returns the index of the first byte that makes the text invalid, or -1, and updates *state */
+static Py_ssize_t
+validate_utf8(const uint8_t *buf, Py_ssize_t n, uint32_t *state)
+{
+    uint32_t s = *state;
+    Py_ssize_t i = 0;
+
+    while (i < n) {
+        /* Skip through ascii 8 bytes at a time when not inside a character */
+        if (s == UTF8_ACCEPT) {
+            while (i + 8 <= n) {
+                uint64_t data;
+                memcpy(&data, buf + i, 8);
+                if (data & 0x8080808080808080ULL) {
+                    break;
+                }
+                i += 8;
+            }
+
+            if (i == n) {
+                break;
+            }
+        }
+
+        s = utf8d[256 + s + utf8d[buf[i]]];
+        if (s == UTF8_REJECT) {
+            *state = s;
+            return i;
+        }
+        i++;
+    }
+
+    *state = s;
+    return -1;
+}
+
+/* Unmask and validate in blocks, so that each block is validated while it is still in the cache */
+#define FUSED_BLOCK 4096
+
+PyDoc_STRVAR(unmask_utf8_doc,
+"unmask_utf8(buffer, mask, state)\n"
+"--\n"
+"\n"
+"Unmask a text payload in place and validate it as utf-8 in the same pass.\n"
+"\n"
+":param buffer: The masked payload, its mask offset must start at 0.\n"
+":type buffer: bytearray\n"
+":param mask: The 4 byte masking key.\n"
+":type mask: bytes\n"
+":param state: The validator state after the previous payload of the message, 0 for the first.\n"
+":type state: int\n"
+":return: (state, index) the state to pass with the next payload, it is 0 if the text ends on a whole character.\n"
+"    index is the position of the first invalid byte, or -1 if the payload is valid so far.\n");
+
+static PyObject *
+unmask_utf8(PyObject *self, PyObject *args)
+{
+    Py_buffer buffer;
+    Py_buffer mask;
+    unsigned int state;
+    Py_ssize_t offset = 0;
+    Py_ssize_t invalid = -1;
+    uint32_t s;
+
+    if (!PyArg_ParseTuple(args, "w*y*I:unmask_utf8", &buffer, &mask, &state)) {
+        return NULL;
+    }
+
+    if (mask.len != 4) {
+        PyBuffer_Release(&buffer);
+        PyBuffer_Release(&mask);
+        PyErr_SetString(PyExc_ValueError, "mask must be 4 bytes");
+        return NULL;
+    }
+
+    if (state > UTF8_REJECT * 8 || state % UTF8_REJECT != 0) {
+        PyBuffer_Release(&buffer);
+        PyBuffer_Release(&mask);
+        PyErr_SetString(PyExc_ValueError, "invalid utf-8 validator state");
+        return NULL;
+    }
+
+    s = state;
+    while (offset < buffer.len) {
+        Py_ssize_t block = buffer.len - offset < FUSED_BLOCK ? buffer.len - offset : FUSED_BLOCK;
+        uint8_t *p = (uint8_t *)buffer.buf + offset;
+
+        /* FUSED_BLOCK is a multiple of 4, so every block starts at mask[0] */
+        unmask_inplace(p, block, (const uint8_t *)mask.buf);
+        if (invalid < 0 && s != UTF8_REJECT) {
+            invalid = validate_utf8(p, block, &s);
+            if (invalid >= 0) {
+                invalid += offset;
+            }
+        }
+
+        offset += block;
+    }
+
+    PyBuffer_Release(&buffer);
+    PyBuffer_Release(&mask);
+    return Py_BuildValue("In", (unsigned int)s, invalid);
+}
+
+PyDoc_STRVAR(unmask_doc,
+"unmask(buffer, mask)\n"
+"--\n"
+"\n"
+"Unmask a payload in place.\n"
+"\n"
+":param buffer: The masked payload, its mask offset must start at 0.\n"
+":type buffer: bytearray\n"
+":param mask: The 4 byte masking key.\n"
+":type mask: bytes\n");
+
+static PyObject *
+unmask(PyObject *self, PyObject *args)
+{
+    Py_buffer buffer;
+    Py_buffer mask;
+
+    if (!PyArg_ParseTuple(args, "w*y*:unmask", &buffer, &mask)) {
+        return NULL;
+    }
+
+    if (mask.len != 4) {
+        PyBuffer_Release(&buffer);
+        PyBuffer_Release(&mask);
+        PyErr_SetString(PyExc_ValueError, "mask must be 4 bytes");
+        return NULL;
+    }
+
+    unmask_inplace((uint8_t *)buffer.buf, buffer.len, (const uint8_t *)mask.buf);
+
+    PyBuffer_Release(&buffer);
+    PyBuffer_Release(&mask);
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef mask_methods[] = {
+    {"unmask", unmask, METH_VARARGS, unmask_doc},
+    {"unmask_utf8", unmask_utf8, METH_VARARGS, unmask_utf8_doc},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef mask_module = {
+    PyModuleDef_HEAD_INIT,
+    "websocket.stream._mask",
+    "Compiled unmasking, used by websocket.stream.mask when it could be built.",
+    -1,
+    mask_methods
+};
+
+PyMODINIT_FUNC
+PyInit__mask(void)
+{
+    return PyModule_Create(&mask_module);
+}
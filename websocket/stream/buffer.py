@@ -15,14 +15,18 @@ class Buffer:
         :param loop: The running event loop
         """
         self.backing = bytearray(limit)
+        self._view = memoryview(self.backing)  # Slicing the view does not copy, unlike slicing the bytearray
         self._loop = loop
         self.read_available = 0
         self.write_available = limit
         self.limit = limit
         self.read_head = 0
         self.write_head = 0
-        self.read_signal = asyncio.Event(loop=loop)
-        self.write_signal = asyncio.Event(loop=loop)
+        # A reader waiting for data and a writer waiting for room, each is only woken once there is enough for it
+        self._read_waiter = None
+        self._read_threshold = 0
+        self._write_waiter = None
+        self._write_threshold = 0
         self.eof = False
         self.exc = None
 
@@ -30,27 +34,32 @@ class Buffer:
         """Write some data to the buffer, length must not exceed the buffer limit, or else it will block forever.
         
         :param data: The data to write
-        :type data: iterable of bytes
+        :type data: bytes, bytearray or memoryview
         """
         length = len(data)
 
         while self.write_available < length:
-            await self.read_signal.wait()
-
-        tail = self.limit - self.write_head
-        if tail < length:
-            self.backing[self.write_head:] = data[:tail]
-            self.backing[:length - tail] = data[tail:]
-            self.write_head = length - tail
+            await self._wait_for_write(length)
+
+        head = self.write_head
+        end = head + length
+        limit = self.limit
+        if end <= limit:
+            # The common case, the data fits before the end of the backing buffer
+            self._view[head:end] = data
+            self.write_head = end if end < limit else 0
         else:
-            self.backing[self.write_head:self.write_head + length] = data
-            self.write_head += length
+            tail = limit - head
+            data = memoryview(data)
+            self._view[head:] = data[:tail]
+            self._view[:length - tail] = data[tail:]
+            self.write_head = length - tail
 
         self.read_available += length
         self.write_available -= length
 
-        self.write_signal.set()
-        self.write_signal.clear()
+        if self._read_waiter is not None and self.read_available >= self._read_threshold:
+            self._wake_reader()
 
     async def read(self, n=-1, chunksize=None):
         """Read data from the buffer. Reads until eof or n bytes.
@@ -63,10 +72,11 @@ class Buffer:
 
         if n < 0:
             buffer = bytearray(chunksize)
+            view = memoryview(buffer)
             result = bytearray()
-            while not self.eof:
+            while not self.at_eof():
                 read = await self.read_into(buffer, chunksize)
-                result.extend(buffer[:read])
+                result.extend(view[:read])
 
             return result
         else:
@@ -90,11 +100,14 @@ class Buffer:
         """
         await self._wait_for_read(n)
 
-        if self.eof:
-            if self.read_available < n:
-                raise IncompleteReadError(f"{self.read_available} bytes available of {n} expected bytes")
+        # Waiting only stops short of n bytes at eof or on an exception
+        if self.read_available < n:
+            if self.exc is not None:
+                raise self.exc
+
+            raise IncompleteReadError(f"{self.read_available} bytes available of {n} expected bytes")
 
-        await self._read_into(buffer, n, offset=offset)
+        self._read_into(buffer, n, offset)
 
     async def read_into(self, buffer, n, offset=0):
         """Read data from the buffer into a bytearray. Reads until eof or n bytes.
@@ -107,44 +120,117 @@ class Buffer:
         """
         await self._wait_for_read(n)
 
-        if self.eof:
+        if self.eof or self.exc is not None:
             n = min(self.read_available, n)
 
-        return await self._read_into(buffer, n, offset=offset)
+        return self._read_into(buffer, n, offset)
+
+    async def read_view(self, n, at_most=None):
+        """Read data from the buffer without copying it. Reads until eof or n bytes, but stops early at the end of
+        the backing buffer, so the view may be shorter than n even before eof.
+
+        The data stays in the buffer until it is released with :meth:`consume`, which must be done before reading again.
+
+        >>> view = await buffer.read_view(1024)
+        >>> transport.write(bytes(view))
+        >>> buffer.consume(len(view))
+
+        :param n: The most data to read, must not exceed the buffer limit.
+        :param at_most: If given, read up to this much of what is already in the buffer once n bytes are there,
+            instead of only n.
+        :return: A :class:`memoryview` of the data, it may be overwritten once consumed.
+        """
+        await self._wait_for_read(n)
+
+        if at_most is not None:
+            n = at_most
+
+        available = self.read_available
+        head = self.read_head
+        if n > available:
+            n = available
+
+        if n > self.limit - head:
+            n = self.limit - head
+
+        return self._view[head:head + n]
+
+    def consume(self, n):
+        """Release the first n bytes returned by :meth:`read_view`."""
+        head = self.read_head + n
+        self.read_head = head if head < self.limit else 0
+        self._consumed(n)
 
     async def _wait_for_read(self, n):
         while self.read_available < n and not self.eof and not self.exc:
-            await self.write_signal.wait()
-
-        if self.exc:
+            if self._read_waiter is not None:
+                raise RuntimeError("Buffer is already being read from by another coroutine")
+
+            self._read_waiter = self._loop.create_future()
+            self._read_threshold = n
+            try:
+                await self._read_waiter
+            finally:
+                self._read_waiter = None
+
+        # Data that is already in the buffer is read before the exception is raised
+        if self.exc is not None and self.read_available == 0:
             raise self.exc
 
-    async def _read_into(self, buffer, n, offset=0):
+    async def _wait_for_write(self, n):
+        if self._write_waiter is not None:
+            raise RuntimeError("Buffer is already being written to by another coroutine")
+
+        self._write_waiter = self._loop.create_future()
+        self._write_threshold = n
+        try:
+            await self._write_waiter
+        finally:
+            self._write_waiter = None
+
+    def _wake_reader(self):
+        if not self._read_waiter.done():
+            self._read_waiter.set_result(None)
+
+    def _read_into(self, buffer, n, offset):
+        # Both read_into variants have already waited for the data, so this never has to suspend
         if n == 0:
             return n
 
-        tail = self.read_head + n
-        if tail > self.limit:
-            remaining = self.limit - self.read_head
-            buffer[offset:offset + remaining] = self.backing[self.read_head:self.limit]
-            buffer[offset + remaining:n] = self.backing[:n - remaining]
-            self.read_head = n - remaining
+        head = self.read_head
+        limit = self.limit
+        if n == 1:
+            # Single bytes are common enough to be worth copying without creating any slices
+            buffer[offset] = self.backing[head]
+            self.read_head = head + 1 if head + 1 < limit else 0
         else:
-            buffer[offset:offset + n] = self.backing[self.read_head:tail]
-            self.read_head = tail
+            tail = head + n
+            if tail > limit:
+                remaining = limit - head
+                buffer[offset:offset + remaining] = self._view[head:limit]
+                buffer[offset + remaining:offset + n] = self._view[:n - remaining]
+                self.read_head = n - remaining
+            else:
+                buffer[offset:offset + n] = self._view[head:tail]
+                self.read_head = tail if tail < limit else 0
+
+        self._consumed(n)
+        return n
 
+    def _consumed(self, n):
         self.read_available -= n
         self.write_available += n
 
-        self.read_signal.set()
-        self.read_signal.clear()
-        return n
+        waiter = self._write_waiter
+        if waiter is not None and self.write_available >= self._write_threshold and not waiter.done():
+            waiter.set_result(None)
 
     def feed_eof(self):
         """Feed the buffer with `end of file`"""
         self.eof = True
         self.write_available = 0
-        self.write_signal.set()
+        if self._read_waiter is not None:
+            self._wake_reader()
 
     def empty(self):
         """
@@ -158,11 +244,23 @@ class Buffer:
         """
         return self.eof and self.read_available == 0
 
+    def reset(self):
+        """Discard all data, `end of file` and any exception so that the buffer can be reused.
+        The backing bytearray is kept.
+        """
+        self.read_available = 0
+        self.write_available = self.limit
+        self.read_head = 0
+        self.write_head = 0
+        self.eof = False
+        self.exc = None
+
     def set_exception(self, exc):
-        """Set an exception to raise at next read."""
+        """Set an exception to raise at the next read that finds the buffer empty."""
         self.exc = exc
         self.write_available = 0
-        self.write_signal.set()
+        if self._read_waiter is not None:
+            self._wake_reader()
 
 
 class IncompleteReadError(Exception):
@@ -6,10 +6,9 @@ get instances through :meth:`websocket.stream.writer.WebSocketWriter.fragment`
 ...     stream.send('Hello ')
 ...     stream.send("World!")
 """
-import asyncio
 import logging
 
-from ..enums import DataType
+from ..enums import DataType, HEADER_BYTES
 
 logger = logging.getLogger(__name__)
 
@@ -24,25 +23,26 @@ class FragmentContext:
         self.writer = writer
         self.data_type = None
         self.previous_fragment = None  # We need to track this so that we can set the fin bit on the last fragment.
-        self.push_task = None
         self.first_write = True
 
     async def _push(self, fragment, fin=False):
-        if self.push_task is not None and not self.push_task.done():
-            await self.push_task
-
-        self.push_task = asyncio.ensure_future(self._write(fragment, fin), loop=self.loop)
+        # Written in place rather than in a task of its own, the transport already buffers what can't be sent yet
+        await self._write(fragment, fin)
 
     async def _write(self, fragment, fin):
         op_code = 0
         if self.first_write:
             logger.debug(f"Start fragment _write: fin = {fin}")
-            op_code = self.data_type.value
+            op_code = self.data_type
             self.first_write = False
         else:
             logger.debug(f"Fragment continuation _write: fin = {fin}")
 
-        self.writer.write_frame((op_code | fin << 7).to_bytes(1, 'big'), fragment, len(fragment))
+        if isinstance(fragment, str):
+            fragment = fragment.encode()
+
+        # write_frame hands the header and the fragment to the transport together
+        self.writer.write_frame(HEADER_BYTES[op_code | fin << 7], fragment, len(fragment))
         await self.writer.writer.drain()
 
     async def send(self, data, force=False):
@@ -71,7 +71,6 @@ class FragmentContext:
     async def finish_send(self):
         if self.previous_fragment is not None:
             await self._push(self.previous_fragment, fin=True)
-            await self.push_task
 
     async def __aenter__(self):
         """Enter the context manager"""
@@ -0,0 +1,60 @@
+"""
+Client to server frames are masked by XOR-ing the payload with a 4 byte key, see
+<https://tools.ietf.org/html/rfc6455#section-5.3>
+
+>>> payload = bytearray(masked_payload)
+>>> unmask(payload, mask)
+
+When the package is installed with a C compiler available, :func:`unmask` is replaced by a compiled version that
+XORs 16 bytes at a time with SSE2 or NEON, and :data:`unmask_utf8` unmasks text and validates it as utf-8 in the same
+pass. Otherwise, if numpy is installed, e.g. with ``pip install asws3[fast]``,
+payloads of at least :data:`NUMPY_THRESHOLD` bytes are unmasked with it.
+"""
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+NUMPY_THRESHOLD = 512  # Below this, calling into numpy costs more than it saves
+
+unmask_utf8 = None  # Only available compiled, text is decoded separately otherwise
+
+
+def unmask(buffer, mask):
+    """Unmask a payload in place.
+
+    Rather than XOR-ing one byte at a time in python, the payload and the repeated key are converted to
+    a single int each so that CPython does the XOR a machine word at a time in C.
+
+    :param buffer: The masked payload, its mask offset must start at 0.
+    :type buffer: bytearray
+    :param mask: The 4 byte masking key.
+    :type mask: bytes
+    """
+    length = len(buffer)
+    if length == 0:
+        return
+
+    if numpy is not None and length >= NUMPY_THRESHOLD:
+        _unmask_numpy(buffer, mask, length)
+        return
+
+    key = (mask * (length // 4 + 1))[:length]
+    buffer[:] = (int.from_bytes(buffer, 'little') ^ int.from_bytes(key, 'little')).to_bytes(length, 'little')
+
+
+def _unmask_numpy(buffer, mask, length):
+    # The payload is XOR-ed with the key 4 bytes at a time, both viewed as native uint32 so the byte order is the same
+    words = length >> 2
+    payload = numpy.frombuffer(buffer, dtype=numpy.uint32, count=words)
+    numpy.bitwise_xor(payload, numpy.frombuffer(mask, dtype=numpy.uint32)[0], out=payload)
+
+    for i in range(words << 2, length):
+        buffer[i] ^= mask[i & 3]
+
+
+try:
+    from ._mask import unmask, unmask_utf8
+except ImportError:
+    pass  # Not compiled, use the python versions above
@@ -10,12 +10,14 @@ callback registerd with :meth:`~websocket.client.Client.message`
 
 import asyncio
 import codecs
+import collections
 import logging
 import struct
 
 from websocket.reasons import Reasons
 from websocket.stream import buffer
-from websocket.stream.writer import WebSocketWriter
+from websocket.stream.mask import unmask, unmask_utf8
+from websocket.stream.writer import MAX_LEN_7
 from ..enums import DataType
 
 logger = logging.getLogger(__name__)
@@ -28,7 +30,14 @@ class WebSocketReader(buffer.Buffer):
     """
     BUFFER_SIZE = 1024
     QUE_MAXSIZE = 12
+    READ_SIZE = 1 << 16  # Payloads are read in pieces of at most this size, so most frames are read in one piece
+    READ_QUE_MAXSIZE = 4  # How many pieces may wait to be unmasked
     MASK_BIT = 1 << 7
+    # "The form '!' is available for those poor souls who claim they can’t remember whether network byte order is
+    # big-endian or little-endian."
+    # - <https://docs.python.org/3/library/struct.html>
+    UNPACK_LENGTH_16_MASK = struct.Struct('!H4s').unpack  # An extended length and the mask that follows it
+    UNPACK_LENGTH_64_MASK = struct.Struct('!Q4s').unpack
     FIN_BIT = 1 << 7
     RSV_BITS = 0b111 << 4
     OP_CODE_BITS = 0b1111
@@ -40,10 +49,14 @@ class WebSocketReader(buffer.Buffer):
         self.data_type = kind
         self.client = client
         self.decoder = WebSocketReader.decoder_factory()
+        self.utf8_state = 0  # The state of the compiled validator, when that is used instead of the decoder
 
-        self.que = asyncio.Queue(WebSocketReader.QUE_MAXSIZE)
+        self.que = _PieceQueue(WebSocketReader.READ_QUE_MAXSIZE, loop)
         self.reading = True
+        self.done_task = None
+        self.processor = None  # Started by the first feed
 
+    def _start_processor(self):
         if self.data_type is DataType.TEXT:
             self.processor = asyncio.ensure_future(self.process_text(), loop=self._loop)
         else:
@@ -67,43 +80,84 @@ class WebSocketReader(buffer.Buffer):
             return data
 
     def done(self):
-        asyncio.ensure_future(self.adone(), loop=self._loop)
+        if self.done_task is None:
+            self.done_task = asyncio.ensure_future(self.adone(), loop=self._loop)
+
+    def reset(self):
+        """Reuse the reader for a new frame without allocating a new backing buffer.
+
+        Any frame still being processed is abandoned, so only call this once the previous frame has been read.
+        """
+        self.cancel()
+        self.que.clear()
+
+        super().reset()
+        self.decoder.reset()
+        self.utf8_state = 0
+        self.reading = True
+
+    def cancel(self):
+        """Stop processing frames, abandoning any pieces that are still queued. Does not feed `end of file`.
+
+        Only :meth:`reset` and :meth:`connection_lost` before the last frame of the message do this, once the last
+        frame has been queued the processor is left to work through the queue.
+        """
+        if self.done_task is not None:
+            self.done_task.cancel()
+            self.done_task = None
+
+        if self.processor is not None:
+            self.processor.cancel()
+            self.processor = None
+
+    def connection_lost(self, exc):
+        """The connection is gone. A message whose last frame was read, see :meth:`done`, is still processed so
+        that all of it can be read, otherwise reading fails with `exc` once what was processed has been read.
+        """
+        if self.done_task is None:
+            self.cancel()
+            self.set_exception(exc)
 
     async def adone(self):
         self.reading = False
 
         try:
-            if self.processor.done():
-                exc = self.processor.exception()
-                if exc:
-                    raise exc
-
-            if self.que.empty():
-                self.processor.cancel()
-                await self.processor
-            else:
+            if self.processor is not None:  # Otherwise it was never fed, so there is nothing to process
+                if self.processor.done():
+                    exc = self.processor.exception()
+                    if exc:
+                        raise exc
+
+                # The processor stops by itself at the None queued after the last piece, having written every piece
+                # into the buffer, a disconnect from here on does not cancel it, see connection_lost
+                await self.que.put(None)
                 await self.processor
 
             if self.data_type is DataType.TEXT:
-                self.decoder.decode(b'', True)
+                if unmask_utf8 is None:
+                    self.decoder.decode(b'', True)
+                elif self.utf8_state != 0:
+                    raise UnicodeDecodeError('utf-8', b'', 0, 0, 'unexpected end of data')
 
             self.feed_eof()
 
         except UnicodeDecodeError as e:
             self.set_exception(e)
-            await self.client.close(Reasons.INCONSISTENT_DATA.value,
-                                    f"{e.object[e.start:e.end]} at {e.start}-{e.end}: {e.reason}"[:WebSocketWriter.MAX_LEN_7])
+            # The reason is ascii, so it can be cut to fit in the close frame, next to the 2 byte code,
+            # without splitting a character
+            reason = f"{e.object[e.start:e.end]} at {e.start}-{e.end}: {e.reason}".encode('ascii', 'replace')
+            await self.client.close(Reasons.INCONSISTENT_DATA.value, reason[:MAX_LEN_7 - 2])
 
     async def process_text(self):
+        que = self.que
+        write_piece = self._write_piece
+        unmask_text = self._unmask_text
         try:
-            while not self.que.empty() or self.reading:
-                data, length, mask = await self.que.get()
-                data = bytearray(data)
-                for i in range(length):
-                    data[i] ^= mask[i % 4]
-
-                self.decoder.decode(data)
-                await self.write(data)
+            piece = await que.get()
+            while piece is not None:
+                data, length, mask = piece
+                await write_piece(data, length, mask, unmask_text)
+                piece = await que.get()
         except UnicodeDecodeError as e:
             self.set_exception(e)
             raise
@@ -111,57 +165,167 @@ class WebSocketReader(buffer.Buffer):
             pass
 
     async def process_binary(self):
+        que = self.que
+        write_piece = self._write_piece
         try:
-            while not self.que.empty() or self.reading:
-                data, length, mask = await self.que.get()
-                data = bytearray(data)
-                for i in range(length):
-                    data[i] ^= mask[i % 4]
-
-                await self.write(data)
+            piece = await que.get()
+            while piece is not None:
+                data, length, mask = piece
+                await write_piece(data, length, mask, unmask)
+                piece = await que.get()
         except asyncio.CancelledError:
             pass
 
-    async def feed_once(self, reader):
-        length = await self.feed(reader)
+    def _unmask_text(self, view, mask):
+        if unmask_utf8 is None:
+            unmask(view, mask)
+            self.decoder.decode(view)
+        else:
+            self.utf8_state, invalid = unmask_utf8(view, mask, self.utf8_state)
+            if invalid >= 0:
+                raise UnicodeDecodeError('utf-8', bytes(view), invalid, invalid + 1, 'invalid utf-8')
+
+    async def _write_piece(self, data, length, mask, unmask_written):
+        # The masked piece is copied into the buffer as it is and unmasked there, with unmask_written,
+        # instead of being copied into a bytearray to unmask it first
+        if length <= self.write_available:
+            await self._write_masked(data, length, mask, unmask_written)
+            return
+
+        # Otherwise the piece is written as room is made for it, rather than waiting for room for all of it at once,
+        # which never comes for a piece larger than the buffer, or while someone waits to read more than is left of it
+        view = memoryview(data)
+        least = self.limit // 8
+        start = 0
+        while start < length:
+            end = start + min(length - start, max(self.write_available, least))
+            await self._write_masked(view[start:end], end - start, _rotate(mask, start), unmask_written)
+            start = end
+
+    async def _write_masked(self, data, length, mask, unmask_written):
+        head = self.write_head
+        await self.write(data)
+
+        # write does not suspend after copying, so nothing can read the data before it is unmasked here
+        end = head + length
+        if end <= self.limit:
+            unmask_written(self._view[head:end], mask)
+        else:
+            # The data was split at the end of the backing buffer
+            tail = self.limit - head
+            unmask_written(self._view[head:], mask)
+            unmask_written(self._view[:length - tail], _rotate(mask, tail))
+
+    async def feed_once(self, reader, length_byte):
+        length = await self.feed(reader, length_byte)
         self.done()
         return length
 
-    async def feed(self, reader):
-        data = await reader.readexactly(1)
-        mask_flag = data[0] & WebSocketReader.MASK_BIT
-        length = data[0] & ~WebSocketReader.MASK_BIT
+    async def feed(self, reader, length_byte):
+        """Read the rest of a frame from the stream reader into the processing queue.
 
-        # "The form '!' is available for those poor souls who claim they can’t remember whether network byte order is
-        # big-endian or little-endian."
-        # - <https://docs.python.org/3/library/struct.html>
-        if length == 126:
-            data = await reader.readexactly(2)
-            length, = struct.unpack('!H', data)
-        elif length == 127:
-            data = await reader.readexactly(8)
-            length, = struct.unpack('!Q', data)
+        :param reader: The stream to read the frame from.
+        :param length_byte: The second byte of the frame header, which has already been read with the first,
+            it holds the mask bit and the 7 bit payload length.
+        :type length_byte: int
+        :return: The payload length.
+        """
+        if self.processor is None:
+            self._start_processor()
 
-        left_to_read = length
+        mask_flag = length_byte & WebSocketReader.MASK_BIT
+        length = length_byte & ~WebSocketReader.MASK_BIT
 
         if not mask_flag:
+            if length == 126:
+                length, = struct.unpack('!H', await reader.readexactly(2))
+            elif length == 127:
+                length, = struct.unpack('!Q', await reader.readexactly(8))
+
             # TODO: Reject frame per <https://tools.ietf.org/html/rfc6455#section-5.1>
             logger.warning("Received message from client without mask.")
-            await reader.readexactly(left_to_read)
+            await reader.readexactly(length)
             raise Exception("Received message from client without mask.")  # TODO: HANDLE
 
-        mask = await reader.readexactly(4)
+        # The extended length, if any, and the mask are read together
+        if length == 126:
+            length, mask = WebSocketReader.UNPACK_LENGTH_16_MASK(await reader.readexactly(6))
+        elif length == 127:
+            length, mask = WebSocketReader.UNPACK_LENGTH_64_MASK(await reader.readexactly(12))
+        else:
+            mask = await reader.readexactly(4)
 
-        first_read_size = min(WebSocketReader.BUFFER_SIZE, left_to_read)
-        await self.que.put((await reader.readexactly(first_read_size), first_read_size, mask))
-        left_to_read -= first_read_size
+        left_to_read = length
+
+        read_size = WebSocketReader.READ_SIZE
+        readexactly = reader.readexactly
+        put = self.que.put
 
-        while left_to_read > WebSocketReader.BUFFER_SIZE:
-            await self.que.put(
-                (await reader.readexactly(WebSocketReader.BUFFER_SIZE), WebSocketReader.BUFFER_SIZE, mask))
-            left_to_read -= WebSocketReader.BUFFER_SIZE
+        # READ_SIZE is a multiple of 4, so every piece starts at the beginning of the mask
+        first_read_size = min(read_size, left_to_read)
+        await put((await readexactly(first_read_size), first_read_size, mask))
+        left_to_read -= first_read_size
 
-        if left_to_read > 0:
-            await self.que.put((await reader.readexactly(left_to_read), left_to_read, mask))
+        while left_to_read > 0:
+            size = min(read_size, left_to_read)
+            await put((await readexactly(size), size, mask))
+            left_to_read -= size
 
         return length
+
+
+def _rotate(mask, offset):
+    """:return: The mask for data that starts `offset` bytes into masked data."""
+    offset &= 3
+    return mask[offset:] + mask[:offset] if offset else mask
+
+
+class _PieceQueue:
+    """The queue between :meth:`WebSocketReader.feed` and the processor. There is only ever one of each, so like
+    :class:`~websocket.stream.buffer.Buffer` each side waits on a single future, made only when it has to wait.
+    """
+    def __init__(self, maxsize, loop):
+        self._items = collections.deque()
+        self._maxsize = maxsize
+        self._loop = loop
+        self._getter = None
+        self._putter = None
+
+    async def put(self, item):
+        items = self._items
+        while len(items) >= self._maxsize:
+            self._putter = self._loop.create_future()
+            try:
+                await self._putter
+            finally:
+                self._putter = None
+
+        items.append(item)
+        getter = self._getter
+        if getter is not None and not getter.done():
+            getter.set_result(None)
+
+    async def get(self):
+        items = self._items
+        while not items:
+            self._getter = self._loop.create_future()
+            try:
+                await self._getter
+            finally:
+                self._getter = None
+
+        item = items.popleft()
+        self._wake_putter()
+        return item
+
+    def empty(self):
+        return not self._items
+
+    def clear(self):
+        self._items.clear()
+        self._wake_putter()
+
+    def _wake_putter(self):
+        putter = self._putter
+        if putter is not None and not putter.done():
+            putter.set_result(None)
@@ -6,29 +6,43 @@ make use of it through :attr:`websocket.client.Client.writer`
 """
 import asyncio
 import logging
+import struct
 
 from .fragment import FragmentContext
-from ..enums import DataType
-from ..reasons import Reasons
+from ..enums import DataType, HEADER_BYTES
+from ..reasons import NO_STATUS
 
 logger = logging.getLogger(__name__)
 
+MAX_LEN_7 = (1 << 7) - 3  # We must subtract 2 more here to make room for the special length codes 126 and 127
+
 
 class WebSocketWriter:
     """
     :ivar closed: True iff the server has sent a close frame to the client.
     """
-    MAX_LEN_7 = (1 << 7) - 3  # We must subtract 2 more here to make room for the special length codes 126 and 127
+    # There is one writer per client
+    __slots__ = ('loop', 'writer', 'closed', 'write_lock')
+
+    MAX_LEN_7 = MAX_LEN_7
     MAX_LEN_16 = (1 << 16) - 1
     MAX_LEN_64 = (1 << 64) - 1
 
     LENGTH_OVER_7 = 126
     LENGTH_OVER_16 = 127
-    LENGTH_OVER_7 = LENGTH_OVER_7.to_bytes(1, 'big')
-    LENGTH_OVER_16 = LENGTH_OVER_16.to_bytes(1, 'big')
+
+    # The length code and the extended length, packed together
+    PACK_LENGTH_16 = struct.Struct('!BH').pack
+    PACK_LENGTH_64 = struct.Struct('!BQ').pack
 
     HEADER_FIN_SET = 1 << 7
 
+    # Payloads over this size are handed to the transport as they are instead of being copied into the frame
+    LARGE_FRAME = 1 << 14
+
+    # Single messages only wait for the transport to drain once it holds more than this many bytes
+    DRAIN_HIGH_WATER = 1 << 16
+
     def __init__(self, writer, loop):
         self.loop = loop
         self.writer = writer
@@ -54,30 +68,50 @@ class WebSocketWriter:
             if not self.ensure_open(force):
                 return
 
+            # Text is encoded once here, everything below only deals with bytes
             if isinstance(data, str):
                 kind = DataType.TEXT
+                data = data.encode()
             else:
                 kind = DataType.BINARY
 
-            logger.debug(f"Sending {kind.name.lower()} to client.")
-            self.write_frame((kind.value | WebSocketWriter.HEADER_FIN_SET).to_bytes(1, 'big'), data, len(data))
-            await self.writer.drain()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending %s to client.", kind.name.lower())
+
+            self.write_frame(kind.fin_header, data, len(data))
+            await self._drain_if_full()
 
     async def close(self, close_code, reason):
+        """Send a close frame to the client.
+
+        :param close_code: The reason for closing, see :class:`~websocket.reasons.Reasons`.
+        :type close_code: :class:`~websocket.reasons.Reason`
+        :param reason: The reason for closing, bytes are taken to be already utf-8 encoded.
+        :type reason: str or bytes
+        """
         with (await self.write_lock):
             logger.debug("Sending close to client.")
 
-            if close_code == Reasons.NO_STATUS.value:
-                self.write_frame(b'\x88', [], 0)
-                await self.writer.drain()
+            if close_code is NO_STATUS:
+                self._write_short(b'\x88', b'', 0)
+            elif not reason:
+                self.writer.write(close_code.close_frame)
             else:
-                data = reason.encode()
+                data = reason.encode() if isinstance(reason, str) else reason
                 length = 2 + len(data)
 
                 if length > WebSocketWriter.MAX_LEN_7:
                     raise Exception(f"Control frames(close) may not be over {WebSocketWriter.MAX_LEN_7} bytes.")
 
-                self.write_frame(b'\x88', b''.join([close_code.code, data]), length)
+                # The code and reason are copied straight into the frame rather than joined together first
+                frame = bytearray(b'\x88')
+                frame.append(length)
+                frame.extend(close_code.code_bytes)
+                frame.extend(data)
+                self.writer.write(frame)
+
+            # Unlike other messages, close waits for anything at all that the socket did not take at once
+            if self.writer.transport.get_write_buffer_size():
                 await self.writer.drain()
 
             self.closed = True
@@ -94,8 +128,8 @@ class WebSocketWriter:
         if length > WebSocketWriter.MAX_LEN_7:
             raise Exception(f"Control frames(ping) may not be over {WebSocketWriter.MAX_LEN_7} bytes.")
 
-        self.write_frame(b'\x89', payload, length)
-        await self.writer.drain()
+        self._write_short(b'\x89', payload, length)
+        await self._drain_if_full()
 
     async def pong(self, length, payload):
         """Send a pong to the client.
@@ -106,8 +140,17 @@ class WebSocketWriter:
         :type length: int
         """
         logger.debug("Sending pong to client.")
-        self.write_frame(b'\x8A', payload, length)
-        await self.writer.drain()
+
+        if length > WebSocketWriter.MAX_LEN_7:
+            raise Exception(f"Control frames(pong) may not be over {WebSocketWriter.MAX_LEN_7} bytes.")
+
+        self._write_short(b'\x8A', payload, length)
+        await self._drain_if_full()
+
+    async def _drain_if_full(self):
+        # drain is a round of coroutine calls even when there is nothing to wait for, most messages don't need it
+        if self.writer.transport.get_write_buffer_size() > WebSocketWriter.DRAIN_HIGH_WATER:
+            await self.writer.drain()
 
     def write_frame(self, header, data, length):
         """Low level method to write a frame to the client, does not flush.
@@ -116,21 +159,87 @@ class WebSocketWriter:
         :param data:  The data to include in the frame
         :param length:  The length of the data
         """
+        if length > WebSocketWriter.LARGE_FRAME:
+            self._send_large(header, data, length)
+        else:
+            self.writer.write(WebSocketWriter.build_frame(header, data, length))
+
+    def _write_short(self, header, data, length):
+        # Control frames are never over MAX_LEN_7, so the length always fits in the second header byte
         frame = bytearray(header)
+        frame.append(length)
+        frame.extend(data)
+        self.writer.write(frame)
 
-        if length > WebSocketWriter.MAX_LEN_64:
-            raise Exception("Message too big, fragment it.")
-        elif length > WebSocketWriter.MAX_LEN_16:
-            frame.extend(WebSocketWriter.LENGTH_OVER_16)
-            frame.extend(length.to_bytes(8, 'big'))
-        elif length > WebSocketWriter.MAX_LEN_7:
-            frame.extend(WebSocketWriter.LENGTH_OVER_7)
-            frame.extend(length.to_bytes(2, 'big'))
+    def _send_large(self, header, data, length):
+        # The header and payload are handed over in one call, so the header never goes out in a tiny segment of its
+        # own. Transports that support it send both with one sendmsg without copying the payload.
+        self.writer.writelines([WebSocketWriter.build_frame(header, b'', length), data])
+
+    @staticmethod
+    def build_frame(header, data, length):
+        """Low level method to serialize a frame without writing it.
+
+        :param header: The frame header, containing the frame type and the fin bit
+        :param data:  The data to include in the frame
+        :param length:  The length of the data
+        :return: A :class:`bytearray` with the complete frame
+        """
+        frame = bytearray(header)
+
+        # Ordered from the most common length, so small frames take a single compare
+        if length <= WebSocketWriter.MAX_LEN_7:
+            frame.append(length)
+        elif length <= WebSocketWriter.MAX_LEN_16:
+            frame.extend(WebSocketWriter.PACK_LENGTH_16(WebSocketWriter.LENGTH_OVER_7, length))
+        elif length <= WebSocketWriter.MAX_LEN_64:
+            frame.extend(WebSocketWriter.PACK_LENGTH_64(WebSocketWriter.LENGTH_OVER_16, length))
         else:
-            frame.extend(length.to_bytes(1, 'big'))
+            raise Exception("Message too big, fragment it.")
 
         frame.extend(data)
-        self.writer.write(frame)
+        return frame
+
+    @staticmethod
+    def build_text_frame(msg):
+        """Serialize an unfragmented text frame once, so that it can be sent to many clients
+        with :meth:`send_frame` without framing it again for each of them.
+
+        >>> frame = WebSocketWriter.build_text_frame('Hello World!')
+        >>> for client in socket.clients.values():
+        ...     await client.writer.send_frame(frame)
+
+        :param msg: The text to send.
+        :type msg: str
+        :return: :class:`bytes`
+        """
+        data = msg.encode()
+        return bytes(WebSocketWriter.build_frame(DataType.TEXT.fin_header, data, len(data)))
+
+    @staticmethod
+    def build_binary_frame(data):
+        """Serialize an unfragmented binary frame once, see :meth:`build_text_frame`.
+
+        :param data: The data to send.
+        :type data: bytes
+        :return: :class:`bytes`
+        """
+        return bytes(WebSocketWriter.build_frame(DataType.BINARY.fin_header, data, len(data)))
+
+    async def send_frame(self, frame, force=False):
+        """Send a frame serialized with :meth:`build_text_frame` or :meth:`build_binary_frame` to the client.
+
+        :param frame: The complete frame.
+        :type frame: bytes
+        :param force: If true send message even if the connection is closing e.g. we got valid message after having previously been sent a close frame from the client or after having received invalid frame(s) 
+        :type force: bool
+        """
+        with (await self.write_lock):
+            if not self.ensure_open(force):
+                return
+
+            self.writer.write(frame)
+            await self._drain_if_full()
 
     def fragment(self):
         """Create a async context manager that can send fragmented messages.
@@ -139,41 +248,55 @@ class WebSocketWriter:
         """
         return FragmentContext(self, self.loop)
 
-    async def feed(self, buffer, op_code=None, chunksize=1024, drain_every=4096, force=False):
-        """Feed the contents of a :class:`~websocket.stream.buffer.Buffer` to the client in `chunksize` fragments.
+    async def feed(self, buffer, op_code=None, chunksize=None, drain_every=1 << 16, force=False, batch_size=MAX_LEN_16):
+        """Feed the contents of a :class:`~websocket.stream.buffer.Buffer` to the client in fragments of at least
+        `chunksize` bytes, except for the last one.
         
         :param buffer: The buffer to read from
         :type buffer: Buffer
         :param op_code: The type of data to send, see :class:`~websocket.enums.DataType`, if None try to read buffer.data_type as if buffer was a :class:`~websocket.stream.reader.WebSocketReader`
         :type op_code: int
-        :param chunksize: The size of each fragment
+        :param chunksize: How much to wait for before sending a fragment, default is a quarter of the buffer limit, up
+            to :attr:`MAX_LEN_16`. Waiting for a whole chunk must leave room for whoever writes into the buffer, or
+            neither can go on.
         :type chunksize: int
         :param drain_every: How often we forcefully drain the writer
         :type drain_every: int
         :param force: If true send message even if the connection is closing e.g. we got valid message after having previously been sent a close frame from the client or after having received invalid frame(s) 
         :type force: bool
+        :param batch_size: The largest fragment, once a chunk is there, each fragment takes as much as the buffer
+            holds, up to this size, rather than one chunk per frame.
+        :type batch_size: int
         """
-        data = bytearray(chunksize)
-
         if op_code is None:
-            op_code = buffer.data_type.value
+            op_code = buffer.data_type
+
+        if chunksize is None:
+            chunksize = min(buffer.limit // 4, WebSocketWriter.MAX_LEN_16)
 
         with (await self.write_lock):
             if not self.ensure_open(force):
                 return
 
+            # Each chunk is framed straight out of the buffer, it is only copied once, into the frame.
+            # The frame is built before the chunk is consumed, so the chunk can't be overwritten in the meantime.
+            header_bytes = HEADER_BYTES
             written_since_drain = 0
-            length = await buffer.read_into(data, chunksize)
-            fin = buffer.at_eof()
+            view = await buffer.read_view(chunksize, batch_size)
+            length = len(view)
+            fin = buffer.eof and buffer.read_available == length
 
-            self.write_frame((op_code | fin << 7).to_bytes(1, 'big'), data[:length], length)
+            self.writer.write(WebSocketWriter.build_frame(header_bytes[op_code | fin << 7], view, length))
+            buffer.consume(length)
             written_since_drain += length
 
             while not fin:
-                length = await buffer.read_into(data, chunksize)
-                fin = buffer.at_eof()
+                view = await buffer.read_view(chunksize, batch_size)
+                length = len(view)
+                fin = buffer.eof and buffer.read_available == length
 
-                self.write_frame((fin << 7).to_bytes(1, 'big'), data[:length], length)
+                self.writer.write(WebSocketWriter.build_frame(header_bytes[fin << 7], view, length))
+                buffer.consume(length)
                 written_since_drain += length
                 if written_since_drain > drain_every:
                     await self.writer.drain()